@@ -45,6 +45,15 @@ def parse_args():
             "ordering is arbitrary."
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        default=1,
+        type=int,
+        help=(
+            "The number of processes to format fields with. Only worthwhile for "
+            "files with many fields."
+        ),
+    )
     parser.add_argument(
         "--diff",
         action="store_true",
@@ -96,13 +105,15 @@ def main():
     """Mushmallow CLI entry-point."""
     args = parse_args()
 
-    orig_lines = args.file.read_text().splitlines()
+    orig_text = args.file.read_text()
+    orig_lines = orig_text.splitlines()
     new_lines = format_marshmallow(
         orig_lines,
         max_line_length=args.max_line_length,
         indent_size=args.indent_size,
         fix_kwargs_for_marshmallow_4=args.fix_kwargs_for_marshmallow_4,
         sort=args.sort,
+        jobs=args.jobs,
     )
 
     if not validate(new_lines):
@@ -115,7 +126,9 @@ def main():
         new_text = "\n".join(new_lines)
         if orig_lines:
             new_text += "\n"
-        args.file.write_text(new_text)
+        # Don't touch the file if nothing changed.
+        if new_text != orig_text:
+            args.file.write_text(new_text)
 
 
 if __name__ == "__main__":
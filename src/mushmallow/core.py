@@ -1,7 +1,9 @@
 """Core functionality for Mushmallow."""
 
 import ast
-import difflib
+import concurrent.futures
+import functools
+import re
 import sys
 import traceback
 
@@ -9,6 +11,35 @@ from .formatting import format_args, format_kwargs, noop
 from .repr_ast import repr_ast
 from .text import indent
 
+# Classify a line of a file in a single match: either the start of a schema
+# definition, or the start of a field definition (i.e. an assignment from
+# something in `fields.`).
+_LINE_RE = re.compile(
+    r"""
+    (?P<schema>\s*class\ .*Schema\):\s*$)
+    | (?P<field>(?=.*fields\.)(?=.*\ =\ ))
+    """,
+    re.VERBOSE,
+)
+# A field without any arguments, exactly as `format_field` would format it.
+_FORMATTED_EMPTY_FIELD_RE = re.compile(r"[A-Za-z_]\w* = fields\.[A-Za-z_]\w*\(\)\Z")
+# The start of a line up to the end of any assignment, keyword, dict key or
+# call name, which is unaffected by formatting the rest of the line.
+_LINE_PREFIX_RE = re.compile(r"[^=(:]*[=(:]?")
+# Brackets, which can each open or close a multi-line expression.
+_OPENING_BRACKETS = "([{"
+_CLOSING_BRACKETS = ")]}"
+# String literals and comments on a single line, which may contain unbalanced
+# parenthesis.
+_STRINGS_AND_COMMENTS_RE = re.compile(
+    r"""
+    "(?:\\.|[^"\\])*"
+    | '(?:\\.|[^'\\])*'
+    | \#.*
+    """,
+    re.VERBOSE,
+)
+
 
 def format_field(
     field,
@@ -29,14 +60,57 @@ def format_field(
     :returns: the list of lines having formatted the field string
     :rtype: list[str]
     """
+    # Schemas often repeat identical field definitions, so the formatting is
+    # cached. The cached lines are a tuple so callers can't mutate the cache.
+    return list(
+        _format_field(
+            field,
+            indent_size,
+            max_line_length,
+            fix_kwargs_for_marshmallow_4,
+            sort_func,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_field(
+    field,
+    indent_size,
+    max_line_length,
+    fix_kwargs_for_marshmallow_4,
+    sort_func,
+):
+    """Format a single field into lines of text.
+
+    See `format_field`.
+
+    :param str field: a single string containing the definition of an entire
+    :param int indent_size: the number of spaces per indent
+    :param int max_line_length: how many characters per line to allow
+    :param bool fix_kwargs_for_marshmallow_4: If True, convert kwarg fields to
+        metadata fields as per Marshmallow 4
+    :param callable sort_func: a function to sort the field kwargs
+
+    :returns: the lines having formatted the field string
+    :rtype: tuple[str]
+    """
     no_indent = field.lstrip()
+    initial_indent_spaces = len(field) - len(no_indent)
+
+    # Fields without any arguments are very common, and if they're already
+    # formatted (including being indented with spaces only) there's nothing to
+    # do.
+    if (
+        initial_indent_spaces % indent_size == 0
+        and field.count(" ", 0, initial_indent_spaces) == initial_indent_spaces
+        and _FORMATTED_EMPTY_FIELD_RE.match(no_indent)
+    ):
+        return (field,)
 
     # Get the pieces we need, i.e. the assignment of the field name, and
     # any args and kwargs passed into the field class.
-    initial_indent_spaces = len(field) - len(no_indent)
-    nodes = ast.parse(no_indent).body
-    assert len(nodes) == 1
-    statement = nodes[0]
+    statement = _parse_field(no_indent)
     first_line = repr_ast(statement)
 
     arg_lines = format_args(
@@ -66,7 +140,25 @@ def format_field(
         new_field_lines,
         number=initial_indent_spaces // indent_size,
     )
-    return restore_comments(field.splitlines(), indented_new_field_lines)
+    return tuple(restore_comments(field.splitlines(), indented_new_field_lines))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_field(source):
+    """Parse the source of a single field definition.
+
+    The same field may appear at different indents or be formatted with
+    different options, so the parsed statement is cached. The returned node is
+    shared, so it must not be modified.
+
+    :param str source: the field definition, without leading indentation
+
+    :returns: the field's assignment statement
+    :rtype: ast.Assign
+    """
+    nodes = ast.parse(source).body
+    assert len(nodes) == 1
+    return nodes[0]
 
 
 def restore_comments(orig_lines, new_lines):
@@ -78,30 +170,163 @@ def restore_comments(orig_lines, new_lines):
     :returns: the new lines, with comments added back in in the same place
     :rtype: list[str]
     """
-    diff = difflib.ndiff(orig_lines, new_lines)
-    outlines = []
-    for line in diff:
-        prefix = line[:2]
-        line = line[2:]
-        if prefix == "? ":
+    # Walk the original lines, matching each one to the first new line after
+    # the previous match which starts the same way (e.g. the same keyword
+    # argument). Comments are put back in before the next matching line, or
+    # straight after the previous one if there's no match.
+    #
+    # Lines which start with a closing bracket all look alike, e.g. the `)`
+    # closing the field and the `),` closing a wrapped kwarg value, so those
+    # are only matched to a new line at the same bracket depth.
+    new_line_info = [
+        (line.strip(), depth)
+        for line, depth in zip(new_lines, _bracket_depths(new_lines))
+    ]
+    comments_before = {}
+    pending_comments = []
+    position = 0
+    for line, depth in zip(orig_lines, _bracket_depths(orig_lines)):
+        stripped = line.strip()
+        if not stripped:
             continue
+        if stripped.startswith("#"):
+            pending_comments.append(line)
+            continue
+
+        prefix = _LINE_PREFIX_RE.match(stripped).group().replace("'", '"')
+        is_closing = stripped[0] in _CLOSING_BRACKETS
+        anchor = next(
+            (
+                idx
+                for idx in range(position, len(new_line_info))
+                if new_line_info[idx][0].startswith(prefix)
+                and not (is_closing and new_line_info[idx][1] != depth)
+            ),
+            None,
+        )
+
+        if pending_comments:
+            insert_at = position if anchor is None else anchor
+            comments_before.setdefault(insert_at, []).extend(pending_comments)
+            pending_comments = []
 
-        if prefix == "- ":
-            if line.lstrip().startswith("#"):
-                outlines.append(line)
-        else:
-            outlines.append(line)
+        if anchor is not None:
+            position = anchor + 1
+
+    comments_before.setdefault(position, []).extend(pending_comments)
+
+    outlines = []
+    for idx, line in enumerate(new_lines):
+        outlines.extend(comments_before.get(idx, []))
+        outlines.append(line)
+    outlines.extend(comments_before.get(len(new_lines), []))
 
     return outlines
 
 
+def _bracket_depths(lines):
+    """Find how deeply nested in brackets each line of some code starts.
+
+    :param list[str] lines: the lines of code
+
+    :returns: the bracket depth at the start of each line
+    :rtype: list[int]
+    """
+    depths = []
+    depth = 0
+    for line in lines:
+        depths.append(depth)
+        # Ignore any brackets in strings or comments
+        code = _STRINGS_AND_COMMENTS_RE.sub("", line)
+        depth += sum(map(code.count, _OPENING_BRACKETS)) - sum(
+            map(code.count, _CLOSING_BRACKETS)
+        )
+    return depths
+
+
+def classify_line(line):
+    """Classify a line of a file.
+
+    :param str line: the line to classify
+
+    :returns: "schema" if the line starts a schema definition, "field" if the
+        line starts a field definition, else None
+    :rtype: str|None
+    """
+    match = _LINE_RE.match(line)
+    return match.lastgroup if match else None
+
+
+def find_fields(lines):
+    """Find the Marshmallow fields defined within schemas in lines of a file.
+
+    :param list[str] lines: the lines of the file to search
+
+    :returns: the `(start, end)` indices of the lines of each field, where
+        `end` is exclusive
+    :rtype: list[tuple[int, int]]
+    """
+    field_spans = []
+    inside_schema = False
+    field_start = None
+    paren_depth = 0
+    for idx, line in enumerate(lines):
+        if field_start is None:
+            line_type = classify_line(line)
+
+            # This is a bit rubbish. We're assuming all Schemas inherit from an
+            # object which ends with "Schema".
+            if line_type == "schema":
+                inside_schema = True
+            elif line and not line.startswith(" "):
+                inside_schema = False
+
+            if not (inside_schema and line_type == "field"):
+                continue
+
+            field_start = idx
+
+        # Only count the parenthesis on the new line, rather than rescanning
+        # the whole of the field each time. Ignore any in strings or comments.
+        code = _STRINGS_AND_COMMENTS_RE.sub("", line)
+        paren_depth += code.count("(") - code.count(")")
+        if paren_depth == 0:
+            # We have an equal number of opening and closing parenthesis. This
+            # means the field class is fully closed. Obviously there a lot of
+            # ways this could fail.
+            field_spans.append((field_start, idx + 1))
+            field_start = None
+
+    return field_spans
+
+
+def _map(func, items, jobs=1):
+    """Apply a function to every item, using multiple processes if requested.
+
+    :param callable func: the function to apply. It must be picklable if
+        `jobs` is more than 1
+    :param iterable items: the items to apply the function to
+    :param int jobs: the number of processes to use
+
+    :returns: the result of the function for each item, in order
+    :rtype: iterator
+    """
+    if jobs > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(func, items)
+    else:
+        yield from map(func, items)
+
+
 def format_marshmallow(
     lines,
     max_line_length=80,
     indent_size=4,
     fix_kwargs_for_marshmallow_4=False,
     sort=False,
-):
+    *,
+    jobs=1,
+):  # pylint: disable=too-many-arguments
     """Format Marshmallow schemas in lines of a file.
 
     :param list[str] lines: the original lines to format
@@ -111,60 +336,73 @@ def format_marshmallow(
         metadata fields as per Marshmallow 4
     :param bool sort: Sort kwarg and/or metadata fields alphabetically.
         Otherwise order is arbitrary.
+    :param int jobs: the number of processes to format fields with. Fields
+        are independent of each other, so can be formatted in parallel.
 
     :returns: the lines of the file having been formatted
     :rtype: list[str]
     """
+    return list(
+        iter_format_marshmallow(
+            lines,
+            max_line_length=max_line_length,
+            indent_size=indent_size,
+            fix_kwargs_for_marshmallow_4=fix_kwargs_for_marshmallow_4,
+            sort=sort,
+            jobs=jobs,
+        )
+    )
+
+
+def iter_format_marshmallow(
+    lines,
+    max_line_length=80,
+    indent_size=4,
+    fix_kwargs_for_marshmallow_4=False,
+    sort=False,
+    *,
+    jobs=1,
+):  # pylint: disable=too-many-arguments
+    """Format Marshmallow schemas in lines of a file, one line at a time.
+
+    Unlike `format_marshmallow`, the formatted lines are produced as they're
+    needed rather than all being held in memory at once.
+
+    :param list[str] lines: see `format_marshmallow`
+    :param int max_line_length: see `format_marshmallow`
+    :param int indent_size: see `format_marshmallow`
+    :param bool fix_kwargs_for_marshmallow_4: see `format_marshmallow`
+    :param bool sort: see `format_marshmallow`
+    :param int jobs: see `format_marshmallow`
+
+    :returns: the lines of the file having been formatted
+    :rtype: iterator[str]
+    """
     if sort:
         sort_func = sorted
     else:
         sort_func = noop
 
-    outlines = []
-    inside_schema = False
-    inside_field = False
-    curr_field = ""
-    for line in lines:
-        # This is a bit rubbish. We're assuming all Schemas inherit from an
-        # object which ends with "Schema".
-        if line.strip().startswith("class ") and line.endswith("Schema):"):
-            inside_schema = True
-        elif line and not line.startswith(" "):
-            inside_schema = False
-
-        if not inside_schema:
-            outlines.append(line)
-            continue
-
-        # From this point, we are inside a schema definition
-        if " = " in line and "fields." in line:
-            inside_field = True
-
-        if inside_field:
-            # Accumulate all lines within a field definition, suppressing output
-            # until we accumulate a whole definition.
-            curr_field += f"{line}\n"
-        else:
-            outlines.append(line)
-
-        if curr_field and curr_field.count("(") == curr_field.count(")"):
-            # We're accumulateing a field, and we have an equal number of
-            # opening and closing parenthesis. This means the field class is
-            # fully closed. Obviously there a lot of ways this could fail.
-            field = curr_field
-            curr_field = ""
-            inside_field = False
-
-            field_lines = format_field(
-                field,
-                indent_size=indent_size,
-                max_line_length=max_line_length - indent_size,
-                fix_kwargs_for_marshmallow_4=fix_kwargs_for_marshmallow_4,
-                sort_func=sort_func,
-            )
-            outlines.extend(field_lines)
+    field_spans = find_fields(lines)
+    formatted_fields = _map(
+        functools.partial(
+            format_field,
+            indent_size=indent_size,
+            max_line_length=max_line_length - indent_size,
+            fix_kwargs_for_marshmallow_4=fix_kwargs_for_marshmallow_4,
+            sort_func=sort_func,
+        ),
+        ("\n".join(lines[start:end]) for start, end in field_spans),
+        jobs=jobs,
+    )
 
-    return outlines
+    prev_end = 0
+    for (start, end), field_lines in zip(field_spans, formatted_fields):
+        # Copy everything between the fields verbatim
+        yield from lines[prev_end:start]
+        yield from field_lines
+        prev_end = end
+    yield from lines[prev_end:]
 
 
 def validate(new_lines):
@@ -1,6 +1,7 @@
 """Format output lines."""
 
 import ast
+import functools
 import inspect
 import json
 
@@ -10,6 +11,27 @@ import marshmallow
 from . import text
 from .repr_ast import repr_ast
 
+# Black always indents by four spaces.
+_BLACK_INDENT_SIZE = 4
+
+# Encode dict values for output. Non-ASCII characters are kept as they were
+# written, rather than being escaped.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Characters in strings which black might change the quoting of.
+_UNSTABLE_STR_CHARS = frozenset("\"'\\\n")
+
+# The types of constant for which `repr_ast` produces exactly what black would
+# (bools are ints)
+_STABLE_CONSTANT_TYPES = (str, int, type(None), type(Ellipsis))
+
+# The keyword arguments accepted by Marshmallow fields. These are constant, so
+# compute them once rather than inspecting the signatures for every field.
+_FIELD_KWARGS = frozenset(inspect.signature(marshmallow.fields.Field).parameters)
+_NESTED_KWARGS = _FIELD_KWARGS | frozenset(
+    inspect.signature(marshmallow.fields.Nested).parameters
+)
+
 
 def noop(first_arg, *args, **kwargs):  # pylint: disable=unused-argument
     # pylint: disable=missing-function-docstring
@@ -17,6 +39,37 @@ def noop(first_arg, *args, **kwargs):  # pylint: disable=unused-argument
     return first_arg
 
 
+@functools.lru_cache
+def _file_mode(line_length):
+    """Get the black mode for formatting at a given line length.
+
+    The mode is constant for a given line length, so reuse it rather than
+    constructing a new one every time black is invoked.
+
+    :param int line_length: the maximum length of line black should produce
+
+    :returns: the black mode
+    :rtype: black.FileMode
+    """
+    return black.FileMode(line_length=line_length)
+
+
+@functools.lru_cache(maxsize=4096)
+def _black_format(src, line_length):
+    """Format source code with black.
+
+    Fields commonly repeat the same values, so the result is cached to avoid
+    running black over the same source again.
+
+    :param str src: the source code to format
+    :param int line_length: the maximum length of line black should produce
+
+    :returns: the formatted lines
+    :rtype: tuple[str]
+    """
+    return tuple(black.format_str(src, mode=_file_mode(line_length)).splitlines())
+
+
 def format_metadata(metadata, indent_size=4, max_line_length=80, sort_func=noop):
     """Format the metadata dictionary for Marshmallow.
 
@@ -40,6 +93,7 @@ def format_metadata(metadata, indent_size=4, max_line_length=80, sort_func=noop)
         "metadata={",
     ]
     items = []
+    item_width = max_line_length - indent_size
     for meta_name, meta_value in sort_func(metadata.items()):
         items.extend(
             maybe_wrap_line(
@@ -48,7 +102,7 @@ def format_metadata(metadata, indent_size=4, max_line_length=80, sort_func=noop)
                 meta_value,
                 "()",
                 indent_size=indent_size,
-                width=max_line_length - indent_size,
+                width=item_width,
             )
         )
     meta_lines.extend(text.indent(items))
@@ -91,18 +145,21 @@ def maybe_wrap_line(
         line and returned as a single-element list
     :rtype: list[str]
     """
-    is_string = second_bit.startswith('"') and second_bit.endswith('"')
+    is_string = len(second_bit) >= 2 and second_bit[0] == second_bit[-1] == '"'
     quote = ""
     if is_string:
-        # Strip the quotes off each end of the text, we'll requote later
-        second_bit = text.strip_quotes(second_bit)
+        # Strip the quotes off each end of the text, we'll requote later. We
+        # already know they're double quotes, so just slice them off.
+        second_bit = second_bit[1:-1]
         # We're going to quote in double quotes, so we have to escape any double
-        # quotes within the string.
-        second_bit = second_bit.replace('"', '\\"')
+        # quotes (and backslashes, etc.) within the string.
+        second_bit = text.escape_string(second_bit)
         quote = '"'
 
-    new_line = f"{first_bit}{sep}{quote}{second_bit}{quote},"
-    if len(new_line) > width:
+    # Work out how long the line would be without building it, as it's thrown
+    # away if it needs wrapping. The 1 is for the trailing comma.
+    line_length = len(first_bit) + len(sep) + 2 * len(quote) + len(second_bit) + 1
+    if line_length > width:
         if is_string:
             wrapped_lines = text.indent(
                 text.wrap_text(second_bit, width=width - indent_size)
@@ -111,19 +168,54 @@ def maybe_wrap_line(
             new_lines.extend(wrapped_lines)
             new_lines.append(f"{parens[1]},")
         else:
-            new_lines = black.format_str(
-                second_bit,
-                mode=black.FileMode(line_length=width - indent_size),
-            ).splitlines()
+            new_lines = list(_black_format(second_bit, width - indent_size))
             new_lines[0] = f"{first_bit}{sep}{new_lines[0]}"
             new_lines[-1] = f"{new_lines[-1]},"
 
     else:
-        new_lines = [new_line]
+        new_lines = [f"{first_bit}{sep}{quote}{second_bit}{quote},"]
 
     return new_lines
 
 
+def _is_black_stable(node):
+    """Check whether black would leave the repr of a node unchanged.
+
+    This is true for simple names, constants, attributes and calls made up of
+    them, as long as they fit on a single line.
+
+    :param ast.AST node: the node to check
+
+    :returns: True if black wouldn't change the node's repr, else False
+    :rtype: bool
+    """
+    if isinstance(node, ast.Name):
+        ret = True
+    elif isinstance(node, ast.Constant):
+        # Strings are naively quoted by `repr_ast`, so leave anything that
+        # might need escaping to black. Other types (bytes, floats, complex)
+        # can be written differently by black, e.g. `1e20` vs `1e+20`.
+        value = node.value
+        ret = isinstance(value, _STABLE_CONSTANT_TYPES) and not (
+            isinstance(value, str) and _UNSTABLE_STR_CHARS & set(value)
+        )
+    elif isinstance(node, ast.Attribute):
+        ret = _is_black_stable(node.value)
+    elif isinstance(node, ast.Call):
+        ret = (
+            _is_black_stable(node.func)
+            and all(_is_black_stable(arg) for arg in node.args)
+            and all(
+                kw.arg is not None and _is_black_stable(kw.value)
+                for kw in node.keywords
+            )
+        )
+    else:
+        ret = False
+
+    return ret
+
+
 def format_args(call, max_line_length=80):
     """Format positional arguments from a function call.
 
@@ -134,20 +226,27 @@ def format_args(call, max_line_length=80):
     :returns: the list of lines from having formatted the the metadata
     :rtype: list[str]
     """
-    # Format each arg, which might go over multiple lines.
-    args = []
-    for arg in call.args:
-        args.extend(
-            black.format_str(
-                repr_ast(arg, full_call_repr=True),
-                mode=black.FileMode(line_length=max_line_length),
-            ).splitlines()
+    arg_reprs = [repr_ast(arg, full_call_repr=True) for arg in call.args]
+    if all(
+        _is_black_stable(arg) and len(arg_repr) < max_line_length
+        for arg, arg_repr in zip(call.args, arg_reprs)
+    ):
+        # Black wouldn't change any of the args, so don't bother running it.
+        arg_lines = [f"{arg_repr}," for arg_repr in arg_reprs]
+    else:
+        # Rather than running black once per arg, format them all in one go as
+        # the elements of a tuple. The magic trailing comma puts each arg on
+        # its own line(s), followed by a comma, so we just need to remove the
+        # enclosing parenthesis and black's indentation. A tuple of one arg
+        # which fits is left on one line, so just remove the parenthesis.
+        formatted = _black_format(
+            f"({', '.join(arg_reprs)},)",
+            max_line_length + _BLACK_INDENT_SIZE,
         )
-
-    arg_lines = [
-        f"{arg}," if not (arg.endswith(",") or arg.endswith("(")) else arg
-        for arg in args
-    ]
+        if len(formatted) == 1:
+            arg_lines = [formatted[0][1:-1]]
+        else:
+            arg_lines = [line[_BLACK_INDENT_SIZE:] for line in formatted[1:-1]]
     return arg_lines
 
 
@@ -158,19 +257,24 @@ def kwargs_to_metadata(kwargs, nonmetadata_field_kwargs):
     https://github.com/marshmallow-code/marshmallow/commit/013abfd669f64446cc7954d0320cf5f1d668bd49
 
     :param dict kwargs: the keyword arguments to a marshmallow field
-    :param set[str] nonmetadata_field_kwargs: the set of valid keyword
+    :param frozenset[str] nonmetadata_field_kwargs: the set of valid keyword
         arguments (and anything else is metadata)
 
     :returns: the modified kwargs
     :rtype: dict
     """
-    new_kwargs = {}
-    metadata = kwargs.pop("metadata", {})
-    for kwarg_name, kwarg_value in kwargs.items():
-        if kwarg_name not in nonmetadata_field_kwargs:
-            metadata[kwarg_name] = kwarg_value
-        else:
-            new_kwargs[kwarg_name] = kwarg_value
+    # Partition the kwargs in one pass each, without mutating the input.
+    new_kwargs = {
+        kwarg_name: kwarg_value
+        for kwarg_name, kwarg_value in kwargs.items()
+        if kwarg_name in nonmetadata_field_kwargs and kwarg_name != "metadata"
+    }
+    metadata = dict(kwargs.get("metadata", {}))
+    metadata.update(
+        (kwarg_name, kwarg_value)
+        for kwarg_name, kwarg_value in kwargs.items()
+        if kwarg_name not in nonmetadata_field_kwargs and kwarg_name != "metadata"
+    )
 
     if metadata:
         new_kwargs["metadata"] = metadata
@@ -220,37 +324,34 @@ def format_kwargs(
 
     # Create kwargs dict. We aren't dealing with long lines here, because we
     # will do it later if necessary.
-    kwargs = {
-        kw.arg: (
-            unwrap_ast_dict(kw.value)
-            if isinstance(kw.value, ast.Dict)
-            else repr_ast(kw.value, full_call_repr=True)
-        )
-        for kw in call.keywords
-    }
+    kwargs = {}
+    for kw in call.keywords:
+        value = kw.value
+        if isinstance(value, ast.Dict):
+            kwargs[kw.arg] = unwrap_ast_dict(value)
+        else:
+            kwargs[kw.arg] = repr_ast(value, full_call_repr=True)
 
     if fix_kwargs_for_marshmallow_4:
-        nonmetadata_field_kwargs = set(
-            inspect.signature(marshmallow.fields.Field).parameters.keys()
-        )
-        if call.func.value.id == "fields" and call.func.attr == "Nested":
-            nonmetadata_field_kwargs.update(
-                set(inspect.signature(marshmallow.fields.Nested).parameters.keys())
-            )
+        if call.func.attr == "Nested" and call.func.value.id == "fields":
+            nonmetadata_field_kwargs = _NESTED_KWARGS
+        else:
+            nonmetadata_field_kwargs = _FIELD_KWARGS
         kwargs = kwargs_to_metadata(kwargs, nonmetadata_field_kwargs)
 
     kwarg_lines = []
+    kwarg_width = max_line_length - indent_size
     for kwarg_name, kwarg_value in sort_func(kwargs.items()):
         if kwarg_name == "metadata":
             meta_lines = format_metadata(
                 kwarg_value,
-                max_line_length=max_line_length - indent_size,
+                max_line_length=kwarg_width,
                 sort_func=sort_func,
             )
             kwarg_lines.extend(meta_lines)
         else:
             if isinstance(kwarg_value, dict):
-                kwarg_value = json.dumps(kwarg_value)
+                kwarg_value = _JSON_ENCODER.encode(kwarg_value)
 
             kwarg_lines.extend(
                 maybe_wrap_line(
@@ -259,7 +360,7 @@ def format_kwargs(
                     kwarg_value,
                     "()",
                     indent_size=indent_size,
-                    width=max_line_length - indent_size,
+                    width=kwarg_width,
                 )
             )
 
@@ -26,63 +26,38 @@ def repr_ast(node, full_call_repr=False):
     if not isinstance(node, ast.AST):
         raise ValueError(f"{node!r} is not an AST type")
 
-    node_func_mapping = {
-        ast.Name: _repr_name,
-        ast.Constant: _repr_constant,
-        ast.Attribute: _repr_attribute,
-        ast.arguments: _repr_arguments,
-        ast.keyword: _repr_keyword,
-        ast.Call: _repr_call,
-        ast.Assign: _repr_assign,
-        ast.List: _repr_list,
-        ast.ListComp: _repr_listcomp,
-        ast.Set: _repr_set,
-        ast.SetComp: _repr_setcomp,
-        ast.Dict: _repr_dict,
-        ast.Expr: _repr_expr,
-        ast.Tuple: _repr_tuple,
-        ast.JoinedStr: _repr_joinedstr,
-        ast.FormattedValue: _repr_formattedvalue,
-        ast.BinOp: _repr_binop,
-        ast.Add: lambda *_: "+",
-        ast.Sub: lambda *_: "-",
-        ast.Mult: lambda *_: "*",
-        ast.Pow: lambda *_: "**",
-        ast.Div: lambda *_: "/",
-        ast.Mod: lambda *_: "%",
-        ast.Lambda: _repr_lambda,
-    }
-
-    if repr_func := node_func_mapping.get(node.__class__):
-        ret = repr_func(node, full_call_repr)
-    else:
-        raise RuntimeError(f"Couln't repr {node}")
+    return _repr_ast(node, full_call_repr)
 
-    return ret
 
+def _repr_ast(node, full_call_repr=False):
+    """Format AST as a string, without validating the node.
 
-def _repr_name(node, full_call_repr):  # pylint: disable=unused-argument
-    """Repr an `ast.Name`.
+    Child nodes come straight from the AST, so there is no need to re-validate
+    them on every recursive call; the `_repr_*` functions recurse through this
+    rather than `repr_ast`.
 
-    :param ast.Name node:
-    :param bool full_call_repr:
+    :param ast.AST node: Abstract-Syntax Tree object to be formatted
+    :param bool full_call_repr: see `repr_ast`
 
-    :returns: the repr'd node
+    :returns: The string representation of of the node tree
     :rtype: str
-    """
-    return node.id
-
 
-def _repr_constant(node, full_call_repr):  # pylint: disable=unused-argument
-    """Repr an `ast.Constant`.
+    :raises RuntimeError: If formatting the node is not implemented
+    """
+    # Names and constants are the bulk of the leaves in a field declaration,
+    # so they're handled here rather than going through the dispatch table
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Constant:
+        return text.format_builtin(node.value)
 
-    :param ast.Constant node:
-    :param bool full_call_repr:
+    try:
+        repr_func = _NODE_FUNC_MAPPING[node_type]
+    except KeyError:
+        raise RuntimeError(f"Couldn't repr {node}") from None
 
-    :returns: the repr'd node
-    :rtype: str
-    """
-    return text.format_builtin(node.value)
+    return repr_func(node, full_call_repr)
 
 
 def _repr_attribute(node, full_call_repr):
@@ -94,7 +69,7 @@ def _repr_attribute(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    return f"{repr_ast(node.value, full_call_repr)}.{node.attr}"
+    return f"{_repr_ast(node.value, full_call_repr)}.{node.attr}"
 
 
 def _repr_arguments(node, full_call_repr):  # pylint: disable=unused-argument
@@ -119,7 +94,7 @@ def _repr_keyword(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    return f"{node.arg}={repr_ast(node.value, full_call_repr)}"
+    return f"{node.arg}={_repr_ast(node.value, full_call_repr)}"
 
 
 def _repr_call(node, full_call_repr):
@@ -131,19 +106,14 @@ def _repr_call(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    if full_call_repr:
-        ret = f"{repr_ast(node.func)}("
-        args = ", ".join(repr_ast(arg, full_call_repr) for arg in node.args)
-        ret += args
-        kwargs = ", ".join(repr_ast(kw, full_call_repr) for kw in node.keywords)
-        if args and kwargs:
-            ret += ", "
-        ret += kwargs
-        ret += ")"
-    else:
-        ret = repr_ast(node.func)
+    func = _repr_ast(node.func)
+    if not full_call_repr:
+        return func
 
-    return ret
+    args = ", ".join(_repr_ast(arg, full_call_repr) for arg in node.args)
+    kwargs = ", ".join(_repr_ast(kw, full_call_repr) for kw in node.keywords)
+    params = ", ".join(part for part in (args, kwargs) if part)
+    return f"{func}({params})"
 
 
 def _repr_assign(node, full_call_repr):
@@ -155,8 +125,8 @@ def _repr_assign(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    targets = ", ".join(map(lambda x: repr_ast(x, full_call_repr), node.targets))
-    return f"{targets} = {repr_ast(node.value, full_call_repr)}"
+    targets = ", ".join(_repr_ast(target, full_call_repr) for target in node.targets)
+    return f"{targets} = {_repr_ast(node.value, full_call_repr)}"
 
 
 def _repr_list(node, full_call_repr):
@@ -168,8 +138,8 @@ def _repr_list(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    elts = [repr_ast(elt, full_call_repr) for elt in node.elts]
-    return f"[{', '.join(elts)}]"
+    elts = ", ".join(_repr_ast(elt, full_call_repr) for elt in node.elts)
+    return f"[{elts}]"
 
 
 def _repr_listcomp(node, full_call_repr):
@@ -185,16 +155,13 @@ def _repr_listcomp(node, full_call_repr):
     gen = node.generators[0]
 
     if isinstance(gen.target, ast.Tuple):
-        target = f"{', '.join(repr_ast(elt) for elt in gen.target.elts)}"
+        target = ", ".join(_repr_ast(elt, full_call_repr) for elt in gen.target.elts)
     else:
-        target = repr_ast(gen.target)
+        target = _repr_ast(gen.target, full_call_repr)
+    elt = _repr_ast(node.elt, full_call_repr)
+    iter_ = _repr_ast(gen.iter, full_call_repr)
 
-    ret = (
-        f"[{repr_ast(node.elt)} "
-        f"for {target} "
-        f"in {repr_ast(gen.iter, full_call_repr)}]"
-    )
-    return ret
+    return f"[{elt} for {target} in {iter_}]"
 
 
 def _repr_dict(node, full_call_repr):
@@ -206,11 +173,10 @@ def _repr_dict(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    pairs = [
-        f"{repr_ast(key)}: {repr_ast(val, full_call_repr)}"
-        for key, val in zip(node.keys, node.values)
-    ]
-    return f"{{{', '.join(pairs)}}}"
+    keys = [_repr_ast(key, full_call_repr) for key in node.keys]
+    values = [_repr_ast(value, full_call_repr) for value in node.values]
+    pairs = ", ".join(f"{key}: {value}" for key, value in zip(keys, values))
+    return f"{{{pairs}}}"
 
 
 def _repr_expr(node, full_call_repr):
@@ -222,7 +188,7 @@ def _repr_expr(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    return repr_ast(node.value, full_call_repr)
+    return _repr_ast(node.value, full_call_repr)
 
 
 def _repr_tuple(node, full_call_repr):
@@ -234,8 +200,8 @@ def _repr_tuple(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    elts = [repr_ast(elt, full_call_repr) for elt in node.elts]
-    return f"({', '.join(elts)})"
+    elts = ", ".join(_repr_ast(elt, full_call_repr) for elt in node.elts)
+    return f"({elts})"
 
 
 def _repr_joinedstr(node, full_call_repr):
@@ -247,7 +213,17 @@ def _repr_joinedstr(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    return f'f"{"".join(text.strip_quotes(repr_ast(v, full_call_repr)) for v in node.values)}"'
+    # The literal parts of an f-string are `ast.Constant` strings, which can be
+    # used as-is rather than quoted by `_repr_ast` only to be stripped again
+    parts = "".join(
+        (
+            value.value
+            if isinstance(value, ast.Constant)
+            else _repr_ast(value, full_call_repr)
+        )
+        for value in node.values
+    )
+    return f'f"{parts}"'
 
 
 def _repr_formattedvalue(node, full_call_repr):
@@ -259,7 +235,7 @@ def _repr_formattedvalue(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    return f"{{{repr_ast(node.value, full_call_repr)}}}"
+    return f"{{{_repr_ast(node.value, full_call_repr)}}}"
 
 
 def _repr_binop(node, full_call_repr):
@@ -270,13 +246,27 @@ def _repr_binop(node, full_call_repr):
 
     :returns: the repr'd node
     :rtype: str
+
+    :raises RuntimeError: If formatting the operator is not implemented
     """
-    ret = (
-        f"{repr_ast(node.left, full_call_repr)} "
-        f"{repr_ast(node.op, full_call_repr)} "
-        f"{repr_ast(node.right, full_call_repr)}"
-    )
-    return ret
+    if not (op := _OP_SYMBOLS.get(type(node.op))):
+        raise RuntimeError(f"Couldn't repr {node.op}")
+
+    left = _repr_ast(node.left, full_call_repr)
+    right = _repr_ast(node.right, full_call_repr)
+    return f"{left} {op} {right}"
+
+
+def _repr_operator(node, full_call_repr):  # pylint: disable=unused-argument
+    """Repr a binary operator, e.g. `ast.Add`.
+
+    :param ast.operator node:
+    :param bool full_call_repr:
+
+    :returns: the repr'd node
+    :rtype: str
+    """
+    return _OP_SYMBOLS[type(node)]
 
 
 def _repr_set(node, full_call_repr):
@@ -290,8 +280,8 @@ def _repr_set(node, full_call_repr):
     """
     # TODO: This is identical to a list-comp except for using curly-brackets
     # rather than square-brackets
-    elts = [repr_ast(elt, full_call_repr) for elt in node.elts]
-    return f"{{{', '.join(elts)}}}"
+    elts = ", ".join(_repr_ast(elt, full_call_repr) for elt in node.elts)
+    return f"{{{elts}}}"
 
 
 def _repr_setcomp(node, full_call_repr):
@@ -309,16 +299,13 @@ def _repr_setcomp(node, full_call_repr):
     gen = node.generators[0]
 
     if isinstance(gen.target, ast.Tuple):
-        target = f"{', '.join(repr_ast(elt) for elt in gen.target.elts)}"
+        target = ", ".join(_repr_ast(elt, full_call_repr) for elt in gen.target.elts)
     else:
-        target = repr_ast(gen.target)
+        target = _repr_ast(gen.target, full_call_repr)
+    elt = _repr_ast(node.elt, full_call_repr)
+    iter_ = _repr_ast(gen.iter, full_call_repr)
 
-    ret = (
-        f"{{{repr_ast(node.elt)} "
-        f"for {target} "
-        f"in {repr_ast(gen.iter, full_call_repr)}}}"
-    )
-    return ret
+    return f"{{{elt} for {target} in {iter_}}}"
 
 
 def _repr_lambda(node, full_call_repr):
@@ -330,10 +317,41 @@ def _repr_lambda(node, full_call_repr):
     :returns: the repr'd node
     :rtype: str
     """
-    ret = "lambda"
-    args = repr_ast(node.args, full_call_repr)
+    args = _repr_ast(node.args, full_call_repr)
+    body = _repr_ast(node.body, full_call_repr)
     if args:
-        ret += f" {args}"
-    ret += ": "
-    ret += f"{repr_ast(node.body, full_call_repr)}"
-    return ret
+        return f"lambda {args}: {body}"
+    return f"lambda: {body}"
+
+
+# The symbol for each supported binary operator
+_OP_SYMBOLS = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Pow: "**",
+    ast.Div: "/",
+    ast.Mod: "%",
+}
+
+# Map each type of AST node to the function which repr's it. This is defined
+# once, here, rather than on every (recursive) call to `repr_ast`.
+_NODE_FUNC_MAPPING = {
+    ast.Attribute: _repr_attribute,
+    ast.arguments: _repr_arguments,
+    ast.keyword: _repr_keyword,
+    ast.Call: _repr_call,
+    ast.Assign: _repr_assign,
+    ast.List: _repr_list,
+    ast.ListComp: _repr_listcomp,
+    ast.Set: _repr_set,
+    ast.SetComp: _repr_setcomp,
+    ast.Dict: _repr_dict,
+    ast.Expr: _repr_expr,
+    ast.Tuple: _repr_tuple,
+    ast.JoinedStr: _repr_joinedstr,
+    ast.FormattedValue: _repr_formattedvalue,
+    ast.BinOp: _repr_binop,
+    **dict.fromkeys(_OP_SYMBOLS, _repr_operator),
+    ast.Lambda: _repr_lambda,
+}
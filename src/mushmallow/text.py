@@ -1,7 +1,103 @@
 """Text manipulation."""
 
+import functools
 import textwrap
 
+# Strings of spaces for the common indentation widths, built once rather than on
+# every call to `indent`
+_SPACES = tuple(" " * width for width in range(33))
+
+# Escape sequences for the characters which can't appear as themselves in a
+# double-quoted string literal
+_STRING_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+# The strings for empty containers, which don't need formatting each time
+_EMPTY_CONTAINERS = {list: "[]", tuple: "()", dict: "{}", set: "set()"}
+
+
+def _format_container(container):
+    """Format a list, tuple, dict or set as a string.
+
+    :param object container: the container to format
+
+    :returns: the formatted container
+    :rtype: str
+    """
+    if not container:
+        return _EMPTY_CONTAINERS[type(container)]
+    return str(container)
+
+
+# How to format the other types of constant most often found in source code,
+# looked up by exact type; see `format_builtin`
+_BUILTIN_FORMATTERS = {
+    int: str,
+    float: str,
+    bool: str,
+    type(None): str,
+    list: _format_container,
+    tuple: _format_container,
+    dict: _format_container,
+    set: _format_container,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _text_wrapper(width):
+    """Get a text wrapper for a certain width.
+
+    `textwrap.wrap` builds a new `textwrap.TextWrapper` every time it is
+    called, so keep one per width instead. The wrapper holds no state between
+    calls to `wrap`.
+
+    :param int width: the number of columns to wrap at
+
+    :returns: the text wrapper
+    :rtype: textwrap.TextWrapper
+    """
+    return textwrap.TextWrapper(width=width)
+
+
+def _greedy_wrap(text, width):
+    """Wrap text at a certain width, filling each line as far as possible.
+
+    This gives the same result as `textwrap.wrap`. Text made up of words
+    separated by single spaces, with no hyphens and no words longer than the
+    width, is wrapped directly; anything else is left to `textwrap`, which also
+    has to deal with breaking on hyphens and breaking long words.
+
+    :param str text: the text to wrap
+    :param int width: the number of columns to wrap at
+
+    :returns: the list of lines of wrapped text
+    :rtype: list[str]
+    """
+    words = text.split(" ")
+    if (
+        "" in words
+        or "-" in text
+        or not text.isprintable()
+        or max(map(len, words)) > width
+    ):
+        return _text_wrapper(width).wrap(text)
+
+    lines = []
+    line_words = []
+    line_length = -1
+    for word in words:
+        word_length = len(word) + 1
+        if line_length + word_length > width:
+            lines.append(" ".join(line_words))
+            line_words = [word]
+            line_length = word_length - 1
+        else:
+            line_words.append(word)
+            line_length += word_length
+    lines.append(" ".join(line_words))
+    return lines
+
 
 def wrap_text(text, width=80):
     """Wrap text at a certain width.
@@ -16,18 +112,33 @@ def wrap_text(text, width=80):
     :returns: the list of lines of wrapped text
     :rtype: list[str]
     """
+    return list(iter_wrap_text(text, width=width))
+
+
+def iter_wrap_text(text, width=80):
+    """Wrap text at a certain width, one line at a time.
+
+    Unlike `wrap_text`, the quoted lines are produced as they're needed rather
+    than being collected into a list.
+
+    :param str text: the text to wrap
+    :param int width: the number of columns to wrap at
+
+    :returns: the lines of wrapped text
+    :rtype: iterator[str]
+    """
     # Strip the quotes off each end of the text, we'll requote later
     text = strip_quotes(text)
 
-    wrapped_lines = textwrap.wrap(text, width=width)
-    # Add a space at the end of every line except the last one
-    last_line_idx = len(wrapped_lines)
-    wrapped_lines = [
-        f"{line} " if idx != last_line_idx else line
-        for idx, line in enumerate(wrapped_lines, start=1)
-    ]
-    lines = [format_builtin(line) for line in wrapped_lines]
-    return lines
+    wrapped_lines = _greedy_wrap(text, width)
+
+    # The lines are always strings, so quote them directly rather than going
+    # through `format_builtin`; an f-string is quicker for this than either `+`
+    # or `%`. Add a space at the end of every line except the last one.
+    for line in wrapped_lines[:-1]:
+        yield f'"{line} "'
+    if wrapped_lines:
+        yield f'"{wrapped_lines[-1]}"'
 
 
 def indent(lines, indent_size=4, number=1):
@@ -40,12 +151,25 @@ def indent(lines, indent_size=4, number=1):
     :returns: the list of indented lines:
     :rtype: list[str]
     """
-    assert number >= 0
-    spaces = " " * indent_size * number
-    new_lines = [f"{spaces}{line}" for line in lines]
+    spaces = _indent_prefix(indent_size, number)
+    new_lines = [spaces + line for line in lines]
     return new_lines
 
 
+def _indent_prefix(indent_size, number):
+    """Get the whitespace to indent a line by.
+
+    :param int indent_size: the number of spaces per indent
+    :param int number: the number of indent levels
+
+    :returns: the whitespace
+    :rtype: str
+    """
+    assert number >= 0
+    width = indent_size * number
+    return _SPACES[width] if 0 <= width < len(_SPACES) else " " * width
+
+
 def format_builtin(obj):
     """Format an object of built-in type as a string.
 
@@ -56,11 +180,30 @@ def format_builtin(obj):
     :returns: the formatted object
     :rtype: str
     """
-    if isinstance(obj, str):
-        ret = f'"{obj}"'
-    else:
-        ret = str(obj)
-    return ret
+    # Strings are by far the most common, so quote them directly; an f-string is
+    # quicker for this than calling a formatter
+    if type(obj) is str:  # pylint: disable=unidiomatic-typecheck
+        return f'"{obj}"'
+    if (formatter := _BUILTIN_FORMATTERS.get(type(obj))) is None:
+        # Not one of the usual types: fall back on the (slower) subclass check
+        if isinstance(obj, str):
+            return f'"{obj}"'
+        formatter = str
+    return formatter(obj)
+
+
+def escape_string(text):
+    """Escape the characters in a string which can't appear in a string literal.
+
+    Backslashes, double-quotes and whitespace control characters are replaced
+    by their escape sequences, so that the result can be double-quoted.
+
+    :param str text: the text to escape
+
+    :returns: the escaped text
+    :rtype: str
+    """
+    return text.translate(_STRING_ESCAPES)
 
 
 def strip_quotes(text):
@@ -71,6 +214,6 @@ def strip_quotes(text):
     :returns: the text without quotes
     :rtype: str
     """
-    if (text[0] == '"' and text[-1] == '"') or (text[0] == "'" and text[-1] == "'"):
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
         text = text[1:-1]
     return text
@@ -0,0 +1,32 @@
+"""Shared fixtures for the tests."""
+
+import ast
+import functools
+
+import pytest
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_statement(source):
+    """Parse the first statement from some source code.
+
+    The same snippets are parsed by many parametrized tests, so each one is
+    only parsed once. Nothing under test modifies the nodes, so sharing them
+    between tests is safe.
+
+    :param str source: the source code to parse
+
+    :returns: the AST node of the first statement
+    :rtype: ast.stmt
+    """
+    return ast.parse(source).body[0]
+
+
+@pytest.fixture(name="parse_statement")
+def fixture_parse_statement():
+    """Get a function which parses the first statement of some source code.
+
+    :returns: the parsing function
+    :rtype: callable
+    """
+    return _parse_statement
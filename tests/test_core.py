@@ -4,6 +4,8 @@ import pytest
 
 from mushmallow import core
 
+# pylint: disable=missing-param-doc,missing-type-doc
+
 
 class TestFormatField:
     """Tests for `format_field`."""
@@ -15,6 +17,35 @@ class TestFormatField:
         expected = ["my_field = fields.String()"]
         assert actual == expected
 
+    def test_empty_field__spacing_normalised(self):
+        """Test the spacing of an empty field is normalised."""
+        input_ = "my_field=fields.String( )"
+        actual = core.format_field(input_)
+        expected = ["my_field = fields.String()"]
+        assert actual == expected
+
+    def test_empty_field__tab_indent_normalised(self):
+        """Test a tab-indented empty field is indented with spaces."""
+        input_ = "\t\t\t\tmy_field = fields.String()"
+        actual = core.format_field(input_)
+        expected = ["    my_field = fields.String()"]
+        assert actual == expected
+
+    def test_special_characters_escaped(self):
+        """Test backslashes, quotes and newlines in strings are escaped."""
+        input_ = (
+            "my_field = fields.String("
+            "required=True, description='back\\\\slash, \"quoted\"\\nnewline')"
+        )
+        actual = core.format_field(input_)
+        expected = [
+            "my_field = fields.String(",
+            "    required=True,",
+            '    description="back\\\\slash, \\"quoted\\"\\nnewline",',
+            ")",
+        ]
+        assert actual == expected
+
     def test_minimal(self):
         """Test minimal field."""
         input_ = "my_field = fields.String(required=True)"
@@ -57,6 +88,56 @@ class TestFormatField:
         ]
         assert actual == expected
 
+    def test_comments_stay_with_reformatted_kwargs(self):
+        """Test comments stay before the kwarg they precede."""
+        input_ = "\n".join(
+            [
+                "my_field = fields.String(",
+                "    # First comment",
+                "    required=True, allow_none=True,",
+                "    # Second comment",
+                "    description='foo')",
+            ]
+        )
+        actual = core.format_field(input_)
+        expected = [
+            "my_field = fields.String(",
+            "    # First comment",
+            "    required=True,",
+            "    allow_none=True,",
+            "    # Second comment",
+            '    description="foo",',
+            ")",
+        ]
+        assert actual == expected
+
+    def test_trailing_comment_after_wrapped_kwarg(self):
+        """Test a comment before the closing bracket stays outside a wrap."""
+        long_value = " ".join(["word"] * 20)
+        input_ = "\n".join(
+            [
+                "my_field = fields.String(",
+                "    # First comment",
+                "    required=True,",
+                f"    description='{long_value}',",
+                "    # Second comment",
+                ")",
+            ]
+        )
+        actual = core.format_field(input_)
+        expected = [
+            "my_field = fields.String(",
+            "    # First comment",
+            "    required=True,",
+            "    description=(",
+            '        "word word word word word word word word word word word word word "',
+            '        "word word word word word word word"',
+            "    ),",
+            "    # Second comment",
+            ")",
+        ]
+        assert actual == expected
+
     @pytest.mark.xfail(reason="The nested dict is not repr'd as expected")
     def test_nested_dict_in_metadata(self):
         """Test a nested dict in a metadata."""
@@ -82,6 +163,13 @@ class TestFixKwargsForMarshmallow4:
         expected = ["my_field = fields.String()"]
         assert actual == expected
 
+    def test_empty_field__tab_indent_normalised(self):
+        """Test a tab-indented empty field is indented with spaces."""
+        input_ = "\t\t\t\tmy_field = fields.String()"
+        actual = core.format_field(input_, fix_kwargs_for_marshmallow_4=True)
+        expected = ["    my_field = fields.String()"]
+        assert actual == expected
+
     def test_minimal(self):
         """Test minimal field."""
         input_ = "my_field = fields.String(required=True)"
@@ -149,6 +237,81 @@ class TestFixKwargsForMarshmallow4:
         assert actual == expected
 
 
+class TestClassifyLine:
+    """Tests for `classify_line`."""
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("class MySchema(Schema):", "schema"),
+            ("    class MyNestedSchema(BaseSchema):", "schema"),
+            ("class MySchema(Schema):  ", "schema"),
+            ("    my_field = fields.String(", "field"),
+            ("    my_field = fields.String()", "field"),
+        ],
+    )
+    def test_recognised(self, line, expected):
+        """Test lines which start a schema or field."""
+        actual = core.classify_line(line)
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "class MyClass(object):",
+            "    my_var = 1",
+            "",
+        ],
+    )
+    def test_unrecognised(self, line):
+        """Test lines which don't start a schema or field."""
+        actual = core.classify_line(line)
+        assert actual is None
+
+
+class TestFindFields:
+    """Tests for `find_fields`."""
+
+    def test_no_fields(self):
+        """Test lines without any schema fields."""
+        input_ = [
+            "class MySchema(Schema):",
+            "    pass",
+            "",
+            "the_field = fields.Boolean(required=False)",
+        ]
+        actual = core.find_fields(input_)
+        expected = []
+        assert actual == expected
+
+    def test_single_and_multiline_fields(self):
+        """Test the spans of single- and multi-line fields."""
+        input_ = [
+            "class MySchema(Schema):",
+            "    foo = fields.String()",
+            "",
+            "    bar = fields.Boolean(",
+            "        required=True,",
+            "    )",
+        ]
+        actual = core.find_fields(input_)
+        expected = [(1, 2), (3, 6)]
+        assert actual == expected
+
+    def test_parenthesis_in_strings_and_comments(self):
+        """Test parenthesis in strings and comments don't affect the spans."""
+        input_ = [
+            "class MySchema(Schema):",
+            "    foo = fields.String(  # (",
+            '        description="a (bracketed",',
+            "    )",
+            "    bar = fields.Boolean()",
+        ]
+        actual = core.find_fields(input_)
+        expected = [(1, 4), (4, 5)]
+        assert actual == expected
+
+
 class TestFormatMarshmallow:
     """Tests for `format_marshmallow`."""
 
@@ -369,6 +532,41 @@ class TestFormatMarshmallow:
         ]
         assert actual == expected
 
+    def test_multiple_jobs(self):
+        """Test formatting fields in multiple processes."""
+        input_ = [
+            "class MySchema(Schema):",
+            "    foo = fields.String(required=True)",
+            "    bar = fields.Boolean()",
+            "    qux = fields.Integer(allow_none=True)",
+        ]
+        actual = core.format_marshmallow(input_, jobs=2)
+        expected = [
+            "class MySchema(Schema):",
+            "    foo = fields.String(",
+            "        required=True,",
+            "    )",
+            "    bar = fields.Boolean()",
+            "    qux = fields.Integer(",
+            "        allow_none=True,",
+            "    )",
+        ]
+        assert actual == expected
+
+    def test_iter_format_marshmallow(self):
+        """Test the lines can be produced one at a time."""
+        input_ = [
+            "class MySchema(Schema):",
+            "    foo = fields.String(required=True)",
+        ]
+        actual = core.iter_format_marshmallow(input_)
+        assert next(actual) == "class MySchema(Schema):"
+        assert list(actual) == [
+            "    foo = fields.String(",
+            "        required=True,",
+            "    )",
+        ]
+
     def test_blank_lines_within_schema(self):
         """Test that blank lines within a schema don't matter."""
         input_ = [
@@ -1,13 +1,20 @@
 """Tests for formatting.py."""
 
-import ast
-
 import pytest
 
 from mushmallow import formatting
 
 # pylint: disable=missing-param-doc,missing-type-doc
 
+# A string which needs wrapping over several lines, including one long word
+_VERY_LONG_STRING = f'"this is a v{"e" * 39}ry long string that needs wrapping"'
+# ...and how it is wrapped at a width of 50 (after the opening parenthesis)
+_VERY_LONG_STRING_WRAPPED = (
+    '    "this is a "',
+    '    "veeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeery "',
+    '    "long string that needs wrapping"',
+)
+
 
 class TestFormatMetadata:
     """Tests for `format_metadata`."""
@@ -34,120 +41,89 @@ class TestFormatMetadata:
 class TestMaybeWrapLine:
     """Tests for `maybe_wrap_line`."""
 
-    def test_basic(self):
-        """Basic case when nothing should be wrapped."""
-        actual = formatting.maybe_wrap_line(
-            '"my_field"',
-            ": ",
-            "True",
-            "()",
-        )
-
-        expected = [
-            '"my_field": True,',
-        ]
-        assert actual == expected
-
-    def test_short_string__like_a_dict(self):
-        """Test that a short string isn't wrapped (context: dict)."""
-        actual = formatting.maybe_wrap_line(
-            '"my_field"',
-            ": ",
-            '"this is a short string"',
-            "()",
-        )
-
-        expected = [
-            '"my_field": "this is a short string",',
-        ]
-        assert actual == expected
-
-    def test_short_string__like_a_keyword(self):
-        """Test that a short string isn't wrapped (context: keyword)."""
-        actual = formatting.maybe_wrap_line(
-            "my_field",
-            "=",
-            '"this is a short string"',
-            "()",
-        )
-
-        expected = [
-            'my_field="this is a short string",',
-        ]
-        assert actual == expected
-
-    def test_long_string__like_a_dict(self):
-        """Test that a long string is wrapped (context: dict)."""
-        actual = formatting.maybe_wrap_line(
-            '"my_field"',
-            ": ",
-            '"this is a very long string that needs wrapping"',
-            "()",
-            width=50,
-        )
-
-        expected = [
-            '"my_field": (',
-            '    "this is a very long string that needs wrapping"',
-            "),",
-        ]
-        assert actual == expected
-
-    def test_long_string__like_a_keyword(self):
-        """Test that a long string is wrapped (context: keyword)."""
-        actual = formatting.maybe_wrap_line(
-            "my_field",
-            "=",
-            '"this is a very long string that needs wrapping"',
-            "()",
-            width=50,
-        )
-
-        expected = [
-            "my_field=(",
-            '    "this is a very long string that needs wrapping"',
-            "),",
-        ]
-        assert actual == expected
-
-    def test_very_long_string__like_a_dict(self):
-        """Test that a long string is wrapped (context: dict)."""
-        actual = formatting.maybe_wrap_line(
-            '"my_field"',
-            ": ",
-            f"\"this is a v{'e'.join('' for _ in range(40))}ry long string "
-            f'that needs wrapping"',
-            "()",
-            width=50,
-        )
-
-        expected = [
-            '"my_field": (',
-            '    "this is a "',
-            '    "veeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeery "',
-            '    "long string that needs wrapping"',
-            "),",
-        ]
+    @pytest.mark.parametrize(
+        "first_bit, sep, second_bit, expected",
+        [
+            pytest.param(
+                '"my_field"',
+                ": ",
+                "True",
+                ['"my_field": True,'],
+                id="basic",
+            ),
+            pytest.param(
+                '"my_field"',
+                ": ",
+                '"this is a short string"',
+                ['"my_field": "this is a short string",'],
+                id="short_string__like_a_dict",
+            ),
+            pytest.param(
+                "my_field",
+                "=",
+                '"this is a short string"',
+                ['my_field="this is a short string",'],
+                id="short_string__like_a_keyword",
+            ),
+        ],
+    )
+    def test_not_wrapped(self, first_bit, sep, second_bit, expected):
+        """Test lines which fit within the default width aren't wrapped."""
+        actual = formatting.maybe_wrap_line(first_bit, sep, second_bit, "()")
         assert actual == expected
 
-    def test_very_long_string__like_a_keyword(self):
-        """Test that a long string is wrapped (context: keyword)."""
-        actual = formatting.maybe_wrap_line(
-            "my_field",
-            "=",
-            f"\"this is a v{'e'.join('' for _ in range(40))}ry long string "
-            f'that needs wrapping"',
-            "()",
-            width=50,
-        )
-
-        expected = [
-            "my_field=(",
-            '    "this is a "',
-            '    "veeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeery "',
-            '    "long string that needs wrapping"',
-            "),",
-        ]
+    @pytest.mark.parametrize(
+        "first_bit, sep, second_bit, expected",
+        [
+            pytest.param(
+                '"my_field"',
+                ": ",
+                '"this is a very long string that needs wrapping"',
+                [
+                    '"my_field": (',
+                    '    "this is a very long string that needs wrapping"',
+                    "),",
+                ],
+                id="long_string__like_a_dict",
+            ),
+            pytest.param(
+                "my_field",
+                "=",
+                '"this is a very long string that needs wrapping"',
+                [
+                    "my_field=(",
+                    '    "this is a very long string that needs wrapping"',
+                    "),",
+                ],
+                id="long_string__like_a_keyword",
+            ),
+            pytest.param(
+                '"my_field"',
+                ": ",
+                _VERY_LONG_STRING,
+                [
+                    '"my_field": (',
+                    *_VERY_LONG_STRING_WRAPPED,
+                    "),",
+                ],
+                id="very_long_string__like_a_dict",
+            ),
+            pytest.param(
+                "my_field",
+                "=",
+                _VERY_LONG_STRING,
+                [
+                    "my_field=(",
+                    *_VERY_LONG_STRING_WRAPPED,
+                    "),",
+                ],
+                id="very_long_string__like_a_keyword",
+            ),
+        ],
+    )
+    def test_wrapped(self, first_bit, sep, second_bit, expected):
+        """Test lines which are too long are wrapped in parentheses."""
+        actual = formatting.maybe_wrap_line(first_bit, sep, second_bit, "()", width=50)
         assert actual == expected
 
 
@@ -161,18 +137,18 @@ class TestFormatArgs:
             "my_func(var=1, foo=bar)",
         ],
     )
-    def test_no_args(self, input_):
+    def test_no_args(self, input_, parse_statement):
         """Test a call with no args."""
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_args(call)
 
         expected = []
         assert actual == expected
 
-    def test_one_arg(self):
+    def test_one_arg(self, parse_statement):
         """Test a call with one arg."""
         input_ = "my_func(a)"
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_args(call)
 
         expected = [
@@ -180,10 +156,10 @@ class TestFormatArgs:
         ]
         assert actual == expected
 
-    def test_multiple_args(self):
+    def test_multiple_args(self, parse_statement):
         """Test a call with multiple args."""
         input_ = "my_func(a, 1, True, another_func())"
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_args(call)
 
         expected = [
@@ -194,10 +170,10 @@ class TestFormatArgs:
         ]
         assert actual == expected
 
-    def test_nested_func_calls(self):
+    def test_nested_func_calls(self, parse_statement):
         """Test a call with nested calls."""
         input_ = "my_func(another_func(a, b), foobar(True, [1, 2]))"
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_args(call)
 
         expected = [
@@ -206,6 +182,75 @@ class TestFormatArgs:
         ]
         assert actual == expected
 
+    @pytest.mark.parametrize(
+        "input_, expected",
+        [
+            ("my_func(x ** 2)", ["x**2,"]),
+            ('my_func(b"abc")', ['b"abc",']),
+            ("my_func(1e20)", ["1e20,"]),
+            ("my_func(1.5e-7)", ["1.5e-07,"]),
+        ],
+    )
+    def test_arg_changed_by_black(self, input_, expected, parse_statement):
+        """Test an arg which black reformats even though it's short."""
+        call = parse_statement(input_).value
+        actual = formatting.format_args(call)
+        assert actual == expected
+
+    def test_multiple_args__wrapped(self, parse_statement):
+        """Test multiple args where one needs wrapping over multiple lines."""
+        input_ = (
+            "my_func(validate.OneOf(['aaaaaaaaaaaaaaaa', 'bbbbbbbbbbbbbbbb', "
+            "'cccccccccccccccc', 'dddddddddddddddd']), a)"
+        )
+        call = parse_statement(input_).value
+        actual = formatting.format_args(call, max_line_length=60)
+
+        expected = [
+            "validate.OneOf(",
+            "    [",
+            '        "aaaaaaaaaaaaaaaa",',
+            '        "bbbbbbbbbbbbbbbb",',
+            '        "cccccccccccccccc",',
+            '        "dddddddddddddddd",',
+            "    ]",
+            "),",
+            "a,",
+        ]
+        assert actual == expected
+
+    def test_one_arg__wrapped(self, parse_statement):
+        """Test a single arg which needs wrapping over multiple lines."""
+        input_ = (
+            "my_func(validate.OneOf(['aaaaaaaaaaaaaaaa', 'bbbbbbbbbbbbbbbb', "
+            "'cccccccccccccccc', 'dddddddddddddddd']))"
+        )
+        call = parse_statement(input_).value
+        actual = formatting.format_args(call, max_line_length=60)
+
+        expected = [
+            "validate.OneOf(",
+            "    [",
+            '        "aaaaaaaaaaaaaaaa",',
+            '        "bbbbbbbbbbbbbbbb",',
+            '        "cccccccccccccccc",',
+            '        "dddddddddddddddd",',
+            "    ]",
+            "),",
+        ]
+        assert actual == expected
+
+    def test_one_arg__string_kept(self, parse_statement):
+        """Test a single string arg isn't treated as a docstring by black."""
+        input_ = 'my_func("it\'s a value ")'
+        call = parse_statement(input_).value
+        actual = formatting.format_args(call)
+
+        expected = [
+            '"it\'s a value ",',
+        ]
+        assert actual == expected
+
 
 class TestFormatKwargs:
     """Tests for `format_kwargs`."""
@@ -217,18 +262,18 @@ class TestFormatKwargs:
             "my_func(1, bar)",
         ],
     )
-    def test_no_kwargs(self, input_):
+    def test_no_kwargs(self, input_, parse_statement):
         """Test a call with no kwargs."""
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_kwargs(call)
 
         expected = []
         assert actual == expected
 
-    def test_one_kwarg(self):
+    def test_one_kwarg(self, parse_statement):
         """Test a call with one kwarg."""
         input_ = "my_func(a=1)"
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_kwargs(call)
 
         expected = [
@@ -236,10 +281,10 @@ class TestFormatKwargs:
         ]
         assert actual == expected
 
-    def test_multiple_kwargs(self):
+    def test_multiple_kwargs(self, parse_statement):
         """Test a call with multiple kwargs."""
         input_ = 'my_func(a="abc", b=True, func=another_func())'
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_kwargs(call)
 
         expected = [
@@ -249,7 +294,7 @@ class TestFormatKwargs:
         ]
         assert actual == expected
 
-    def test_nested_func_calls(self):
+    def test_nested_func_calls(self, parse_statement):
         """Test a call with nested calls."""
         input_ = (
             "my_func("
@@ -257,7 +302,7 @@ class TestFormatKwargs:
             "func_b=foobar(True, a_list=[1, 2])"
             ")"
         )
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_kwargs(call)
 
         expected = [
@@ -266,10 +311,10 @@ class TestFormatKwargs:
         ]
         assert actual == expected
 
-    def test_kwargs_to_metadata(self):
+    def test_kwargs_to_metadata(self, parse_statement):
         """Test kwargs are converted to metadata."""
         input_ = 'fields.Nested(many=True, required=False, example="this")'
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_kwargs(call, fix_kwargs_for_marshmallow_4=True)
 
         expected = [
@@ -281,7 +326,7 @@ class TestFormatKwargs:
         ]
         assert actual == expected
 
-    def test_long_nonstring(self):
+    def test_long_nonstring(self, parse_statement):
         """Test wrapping a long kwarg that is not a string."""
         input_ = (
             "fields.Nested("
@@ -294,7 +339,7 @@ class TestFormatKwargs:
             ")), "
             'description="a description")'
         )
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_kwargs(call)
 
         expected = [
@@ -314,11 +359,12 @@ class TestFormatKwargs:
         [
             ("fields.Dict(example={})", ["example={},"]),
             ('fields.Dict(example={"foo": "bar"})', ['example={"foo": "bar"},']),
+            ('fields.Dict(example={"foo": "bär"})', ['example={"foo": "bär"},']),
         ],
     )
-    def test_is_dict(self, input_, expected):
+    def test_is_dict(self, input_, expected, parse_statement):
         """Test when metadata contains a dictionary."""
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_kwargs(call)
         assert actual == expected
 
@@ -335,9 +381,9 @@ class TestFormatKwargs:
             ),
         ],
     )
-    def test_string_contains_quotes(self, input_, expected):
+    def test_string_contains_quotes(self, input_, expected, parse_statement):
         """Test strings containing quotes are escaped if necessary."""
-        call = ast.parse(input_).body[0].value
+        call = parse_statement(input_).value
         actual = formatting.format_kwargs(call)
         print("actual")
         print("\n".join(actual))
@@ -8,212 +8,142 @@ from mushmallow.repr_ast import repr_ast
 
 # pylint: disable=missing-param-doc,missing-type-doc
 
+# Each case is (full_call_repr, input_, expected), grouped by the type of node
+# being formatted
+_CASES = [
+    # ast.Name and ast.Attribute
+    pytest.param(False, "my_var", "my_var", id="name"),
+    pytest.param(False, "my_obj.my_attr", "my_obj.my_attr", id="name"),
+    # ast.Constant
+    pytest.param(False, "1", "1", id="const"),
+    pytest.param(False, "3.14", "3.14", id="const"),
+    pytest.param(False, '"a string"', '"a string"', id="const"),
+    pytest.param(False, "True", "True", id="const"),
+    pytest.param(False, "None", "None", id="const"),
+    # ast.Assign
+    pytest.param(False, "val = 1", "val = 1", id="assign"),
+    pytest.param(False, 'val = "my val"', 'val = "my val"', id="assign"),
+    # Note: no parens because full_call_repr == False
+    pytest.param(False, "val = my_func()", "val = my_func", id="assign"),
+    # ast.List
+    pytest.param(False, "[]", "[]", id="list"),
+    pytest.param(False, "[1]", "[1]", id="list"),
+    pytest.param(False, "[1, 2]", "[1, 2]", id="list"),
+    pytest.param(False, '["a", "b"]', '["a", "b"]', id="list"),
+    # ast.ListComp
+    pytest.param(False, "[x for x in my_iter]", "[x for x in my_iter]", id="listcomp"),
+    pytest.param(
+        False,
+        "[x for x in my_obj.my_iter]",
+        "[x for x in my_obj.my_iter]",
+        id="listcomp",
+    ),
+    pytest.param(
+        False, "[x for x, y in my_iter]", "[x for x, y in my_iter]", id="listcomp"
+    ),
+    pytest.param(
+        False,
+        "[(x, y) for x, y in my_iter]",
+        "[(x, y) for x, y in my_iter]",
+        id="listcomp",
+    ),
+    pytest.param(False, "[i for i in range(10)]", "[i for i in range]", id="listcomp"),
+    # ast.ListComp, with calls in the element and the iterable
+    pytest.param(
+        True,
+        "[i for i in range(10)]",
+        "[i for i in range(10)]",
+        id="listcomp__full_call_repr",
+    ),
+    pytest.param(
+        True,
+        "[str(i) for i in my_iter]",
+        "[str(i) for i in my_iter]",
+        id="listcomp__full_call_repr",
+    ),
+    # ast.Dict
+    pytest.param(False, "{}", "{}", id="dict"),
+    pytest.param(False, '{"a": 1}', '{"a": 1}', id="dict"),
+    pytest.param(False, '{"a": 1, "b": 2}', '{"a": 1, "b": 2}', id="dict"),
+    # ast.Call
+    pytest.param(False, "my_func()", "my_func", id="call__not_full"),
+    pytest.param(False, "my_mod.my_func()", "my_mod.my_func", id="call__not_full"),
+    # ast.Call
+    pytest.param(True, "my_func()", "my_func()", id="call__full"),
+    pytest.param(True, "my_mod.my_func()", "my_mod.my_func()", id="call__full"),
+    pytest.param(True, "my_func(a, b, c=3)", "my_func(a, b, c=3)", id="call__full"),
+    pytest.param(True, "my_func([a, b, c])", "my_func([a, b, c])", id="call__full"),
+    pytest.param(True, "outer(inner())", "outer(inner())", id="call__full"),
+    pytest.param(
+        True,
+        "outer(inner(arg, kwarg=True))",
+        "outer(inner(arg, kwarg=True))",
+        id="call__full",
+    ),
+    # ast.Assign
+    pytest.param(True, "a = 1", "a = 1", id="assign__full_call"),
+    pytest.param(True, 'a = "a"', 'a = "a"', id="assign__full_call"),
+    pytest.param(
+        True, "my_var = my_func()", "my_var = my_func()", id="assign__full_call"
+    ),
+    # ast.BinOp
+    pytest.param(True, "1 - 1", "1 - 1", id="binop"),
+    pytest.param(True, '"a" + "b"', '"a" + "b"', id="binop"),
+    pytest.param(True, "0 / 2", "0 / 2", id="binop"),
+    pytest.param(True, "2 * 2", "2 * 2", id="binop"),
+    pytest.param(True, "2 ** 2", "2 ** 2", id="binop"),
+    pytest.param(True, "2 % 2", "2 % 2", id="binop"),
+    # ast.JoinedStr
+    pytest.param(True, "f'this'", 'f"this"', id="joinedstr"),
+    pytest.param(True, 'f"this"', 'f"this"', id="joinedstr"),
+    pytest.param(True, 'f"a {b} c"', 'f"a {b} c"', id="joinedstr"),
+    pytest.param(True, 'f"a {b} c {last}"', 'f"a {b} c {last}"', id="joinedstr"),
+    pytest.param(True, "f\"'{b}'\"", "f\"'{b}'\"", id="joinedstr"),
+    # ast.Set
+    pytest.param(False, "{}", "{}", id="set"),
+    pytest.param(False, "{1}", "{1}", id="set"),
+    pytest.param(False, "{1, 2}", "{1, 2}", id="set"),
+    pytest.param(False, '{"a", "b"}', '{"a", "b"}', id="set"),
+    # ast.SetComp
+    pytest.param(True, "{a for a in my_set}", "{a for a in my_set}", id="setcomp"),
+    pytest.param(True, "{a for a in my_gen()}", "{a for a in my_gen()}", id="setcomp"),
+    pytest.param(
+        True, "{str(a) for a in my_set}", "{str(a) for a in my_set}", id="setcomp"
+    ),
+    # ast.Lambda
+    pytest.param(True, "lambda: True", "lambda: True", id="lambda"),
+    pytest.param(True, "lambda x: int(x)", "lambda x: int(x)", id="lambda"),
+]
+
 
 class TestReprAst:
     """Tests for `repr_ast`."""
 
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("my_var", "my_var"),
-            ("my_obj.my_attr", "my_obj.my_attr"),
-        ],
-    )
-    def test_repr_name(self, input_, expected):
-        """Test ast.Name."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("1", "1"),
-            ("3.14", "3.14"),
-            ('"a string"', '"a string"'),
-            ("True", "True"),
-            ("None", "None"),
-        ],
-    )
-    def test_repr_const(self, input_, expected):
-        """Test ast.Const."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("val = 1", "val = 1"),
-            ('val = "my val"', 'val = "my val"'),
-            # Note: no parens because full_call_repr == False
-            ("val = my_func()", "val = my_func"),
-        ],
-    )
-    def test_repr_assign(self, input_, expected):
-        """Test ast.Assign."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("[]", "[]"),
-            ("[1]", "[1]"),
-            ("[1, 2]", "[1, 2]"),
-            ('["a", "b"]', '["a", "b"]'),
-        ],
-    )
-    def test_repr_list(self, input_, expected):
-        """Test ast.List."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node)
+    @pytest.mark.parametrize("full_call_repr, input_, expected", _CASES)
+    def test_repr_ast(self, full_call_repr, input_, expected, parse_statement):
+        """Test formatting each type of node."""
+        node = parse_statement(input_)
+        actual = repr_ast(node, full_call_repr=full_call_repr)
         assert actual == expected
 
     @pytest.mark.parametrize(
-        "input_, expected",
+        "node, expected",
         [
-            ("[x for x in my_iter]", "[x for x in my_iter]"),
-            ("[x for x in my_obj.my_iter]", "[x for x in my_obj.my_iter]"),
-            ("[x for x, y in my_iter]", "[x for x, y in my_iter]"),
-            ("[(x, y) for x, y in my_iter]", "[(x, y) for x, y in my_iter]"),
-            ("[i for i in range(10)]", "[i for i in range]"),
+            (ast.Add(), "+"),
+            (ast.Sub(), "-"),
+            (ast.Mult(), "*"),
+            (ast.Pow(), "**"),
+            (ast.Div(), "/"),
+            (ast.Mod(), "%"),
         ],
     )
-    def test_repr_listcomp(self, input_, expected):
-        """Test ast.List."""
-        node = ast.parse(input_).body[0]
+    def test_repr_operator(self, node, expected):
+        """Test a binary operator on its own."""
         actual = repr_ast(node)
         assert actual == expected
 
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("{}", "{}"),
-            ('{"a": 1}', '{"a": 1}'),
-            ('{"a": 1, "b": 2}', '{"a": 1, "b": 2}'),
-        ],
-    )
-    def test_repr_dict(self, input_, expected):
-        """Test ast.Dict."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("my_func()", "my_func"),
-            ("my_mod.my_func()", "my_mod.my_func"),
-        ],
-    )
-    def test_repr_call__not_full(self, input_, expected):
-        """Test ast.Call."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("my_func()", "my_func()"),
-            ("my_mod.my_func()", "my_mod.my_func()"),
-            ("my_func(a, b, c=3)", "my_func(a, b, c=3)"),
-            ("my_func([a, b, c])", "my_func([a, b, c])"),
-            ("outer(inner())", "outer(inner())"),
-            ("outer(inner(arg, kwarg=True))", "outer(inner(arg, kwarg=True))"),
-        ],
-    )
-    def test_repr_call__full(self, input_, expected):
-        """Test ast.Call."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node, full_call_repr=True)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("a = 1", "a = 1"),
-            ('a = "a"', 'a = "a"'),
-            ("my_var = my_func()", "my_var = my_func()"),
-        ],
-    )
-    def test_repr_assign__full_call(self, input_, expected):
-        """Test ast.Assign."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node, full_call_repr=True)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("1 - 1", "1 - 1"),
-            ('"a" + "b"', '"a" + "b"'),
-            ("0 / 2", "0 / 2"),
-            ("2 * 2", "2 * 2"),
-            ("2 ** 2", "2 ** 2"),
-            ("2 % 2", "2 % 2"),
-        ],
-    )
-    def test_repr_binop(self, input_, expected):
-        """Test ast.BinOp."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node, full_call_repr=True)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("f'this'", 'f"this"'),
-            ('f"this"', 'f"this"'),
-            ('f"a {b} c"', 'f"a {b} c"'),
-            ('f"a {b} c {last}"', 'f"a {b} c {last}"'),
-        ],
-    )
-    def test_repr_joinedstr(self, input_, expected):
-        """Test ast.JoinedStr."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node, full_call_repr=True)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("{}", "{}"),
-            ("{1}", "{1}"),
-            ("{1, 2}", "{1, 2}"),
-            ('{"a", "b"}', '{"a", "b"}'),
-        ],
-    )
-    def test_repr_set(self, input_, expected):
-        """Test ast.Set."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("{a for a in my_set}", "{a for a in my_set}"),
-            ("{a for a in my_gen()}", "{a for a in my_gen()}"),
-        ],
-    )
-    def test_repr_setcomp(self, input_, expected):
-        """Test ast.SetComp."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node, full_call_repr=True)
-        assert actual == expected
-
-    @pytest.mark.parametrize(
-        "input_, expected",
-        [
-            ("lambda: True", "lambda: True"),
-            ("lambda x: int(x)", "lambda x: int(x)"),
-        ],
-    )
-    def test_repr_lambda(self, input_, expected):
-        """Test ast.Lambda."""
-        node = ast.parse(input_).body[0]
-        actual = repr_ast(node, full_call_repr=True)
-        assert actual == expected
+    def test_repr_binop__unsupported_operator(self, parse_statement):
+        """Test ast.BinOp with an operator that can't be formatted."""
+        node = parse_statement("2 // 2")
+        with pytest.raises(RuntimeError):
+            repr_ast(node, full_call_repr=True)
@@ -1,11 +1,20 @@
 """Tests for text.py."""
 
+import textwrap
+
 import pytest
 
 from mushmallow import text
 
 # pylint: disable=missing-param-doc,missing-type-doc
 
+# A 120 character string which needs wrapping
+_LONG_TEXT = "aaaaa " * 20
+
+
+class _MyStr(str):
+    """A subclass of `str`, which should be formatted like a `str`."""
+
 
 class TestWrapText:
     """Tests for `wrap_text`."""
@@ -20,7 +29,7 @@ class TestWrapText:
 
     def test_one_long_line(self):
         """Test a long line that needs wrapping."""
-        text_ = "aaaaa " * 20  # 120 character string
+        text_ = _LONG_TEXT
         actual = text.wrap_text(text_, width=60)
 
         expected = [
@@ -31,7 +40,7 @@ class TestWrapText:
 
     def test_one_long_line__short_width(self):
         """Test a long line that needs a lot of wrapping."""
-        text_ = "aaaaa " * 20  # 120 character string
+        text_ = _LONG_TEXT
         actual = text.wrap_text(text_, width=50)
 
         expected = [
@@ -41,6 +50,40 @@ class TestWrapText:
         ]
         assert actual == expected
 
+    @pytest.mark.parametrize(
+        "text_",
+        [
+            "",
+            "word",
+            _LONG_TEXT.strip(),
+            "some hyphenated-words to wrap",
+            "double  spaced  words  to  wrap",
+            " leading and trailing spaces ",
+            "tabs\tand\nnewlines to wrap",
+            "a wordthatismuchtoolongforthewidth",
+        ],
+    )
+    def test_same_as_textwrap(self, text_):
+        """Test greedy wrapping matches `textwrap.wrap`."""
+        actual = text.wrap_text(text_, width=12)
+
+        wrapped = textwrap.wrap(text_, width=12)
+        expected = [f'"{line} "' for line in wrapped[:-1]] + [
+            f'"{line}"' for line in wrapped[-1:]
+        ]
+        assert actual == expected
+
+    def test_iter(self):
+        """Test wrapping text one line at a time."""
+        lines = text.iter_wrap_text(_LONG_TEXT, width=60)
+
+        assert next(lines) == (
+            '"aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa "'
+        )
+        assert list(lines) == [
+            '"aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa aaaaa"'
+        ]
+
 
 class TestIndent:
     """Tests for `indent`."""
@@ -83,6 +126,13 @@ class TestIndent:
         ]
         assert actual == expected
 
+    def test_negative_indent(self):
+        """Test a negative indent size doesn't indent."""
+        actual = text.indent(["this is a line"], indent_size=-1)
+
+        expected = ["this is a line"]
+        assert actual == expected
+
 
 class TestFormatBuiltin:
     """Tests for `format_builtin`."""
@@ -92,6 +142,7 @@ class TestFormatBuiltin:
         [
             ("a string", '"a string"'),
             ('"a quoted string"', '""a quoted string""'),
+            (_MyStr("a subclassed string"), '"a subclassed string"'),
         ],
     )
     def test_input_is_str(self, input_, expected):
@@ -103,10 +154,22 @@ class TestFormatBuiltin:
         "input_, expected",
         [
             (1, "1"),
+            (-1, "-1"),
+            (-5, "-5"),
+            (-6, "-6"),
+            (256, "256"),
+            (257, "257"),
             ([], "[]"),
             ([1, 2, 3], "[1, 2, 3]"),
             ({}, "{}"),
             ({"a": 1}, "{'a': 1}"),
+            ((), "()"),
+            ((1, 2), "(1, 2)"),
+            (set(), "set()"),
+            ({1}, "{1}"),
+            (3.14, "3.14"),
+            (True, "True"),
+            (None, "None"),
         ],
     )
     def test_input_is_anything_else(self, input_, expected):
@@ -115,6 +178,36 @@ class TestFormatBuiltin:
         assert actual == expected
 
 
+class TestEscapeString:
+    """Tests for `escape_string`."""
+
+    @pytest.mark.parametrize(
+        "input_",
+        [
+            "",
+            "nothing to escape",
+            "'single-quotes'",
+        ],
+    )
+    def test_no_change(self, input_):
+        """Test no change to the input."""
+        actual = text.escape_string(input_)
+        assert actual == input_
+
+    @pytest.mark.parametrize(
+        "input_, expected",
+        [
+            ('"a quoted string"', '\\"a quoted string\\"'),
+            ("back\\slash", "back\\\\slash"),
+            ("new\nline\ttab\rreturn", "new\\nline\\ttab\\rreturn"),
+        ],
+    )
+    def test_escaped(self, input_, expected):
+        """Test characters are escaped."""
+        actual = text.escape_string(input_)
+        assert actual == expected
+
+
 class TestStripQuotes:
     """Tests for `strip_quotes`."""
 
@@ -132,6 +225,9 @@ class TestStripQuotes:
             "only trailing single-quote'",
             "\"mismatched quotes'",
             "'mismatched quotes\"",
+            "",
+            '"',
+            "'",
         ],
     )
     def test_no_change(self, input_):